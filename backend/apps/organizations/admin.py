@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import Organization
 
 
@@ -20,6 +21,17 @@ class OrganizationAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # Annotate the count so the changelist renders without one
+        # COUNT query per row
+        return super().get_queryset(request).annotate(
+            _project_count=Count('projects')
+        )
+
     def project_count(self, obj):
+        annotated = getattr(obj, '_project_count', None)
+        if annotated is not None:
+            return annotated
         return obj.project_count
     project_count.short_description = 'Projects'
+    project_count.admin_order_field = '_project_count'
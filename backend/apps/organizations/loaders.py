@@ -0,0 +1,25 @@
+from .models import Organization
+
+
+class OrganizationByIdLoader:
+    """
+    Per-request loader that memoizes Organization lookups by id.
+
+    GraphQL list queries selecting `project { organization { ... } }`
+    otherwise trigger one FK fetch per project; caching by id collapses
+    repeated reads of the same organization into a single SELECT.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def load(self, org_id):
+        """Return the organization for ``org_id``, fetching it at most once."""
+        if org_id not in self._cache:
+            self._cache[org_id] = Organization.objects.filter(pk=org_id).first()
+        return self._cache[org_id]
+
+    def prime(self, organization):
+        """Seed the cache with an already-loaded organization."""
+        if organization is not None:
+            self._cache[organization.pk] = organization
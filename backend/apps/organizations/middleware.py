@@ -1,7 +1,76 @@
+import time
+from functools import lru_cache
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_delete, post_save
 from django.http import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
+from .loaders import OrganizationByIdLoader
 from .models import Organization
 
+# Field order for the cached value tuples. The cache holds immutable
+# tuples rather than model instances so entries can never be mutated
+# by one request and served, changed, to another thread.
+_ORG_FIELDS = (
+    'id', 'name', 'slug', 'contact_email', 'description',
+    'is_active', 'created_at', 'updated_at',
+)
+
+# Cached rows also expire after this many seconds, covering writes the
+# model signals never see (queryset.update(), other processes).
+_ORG_CACHE_TTL = 60
+
+
+def _cache_bucket():
+    """Coarse timestamp mixed into the cache key to give lru_cache a TTL."""
+    return int(time.monotonic() // _ORG_CACHE_TTL)
+
+
+@lru_cache(maxsize=1024)
+def _get_organization_values_by_slug(slug, bucket):
+    """Cached field values of an active organization, looked up by slug."""
+    return (
+        Organization.objects.filter(slug=slug, is_active=True)
+        .values_list(*_ORG_FIELDS)
+        .first()
+    )
+
+
+@lru_cache(maxsize=1024)
+def _get_organization_values_by_id(org_id, bucket):
+    """Cached field values of an active organization, looked up by id."""
+    return (
+        Organization.objects.filter(id=org_id, is_active=True)
+        .values_list(*_ORG_FIELDS)
+        .first()
+    )
+
+
+def _rebuild_organization(values):
+    """
+    Materialize a detached Organization from cached field values.
+
+    Every request gets its own instance, so downstream code can treat
+    request.organization as a normal saved model without sharing state
+    across requests.
+    """
+    if values is None:
+        return None
+    organization = Organization(**dict(zip(_ORG_FIELDS, values)))
+    organization._state.adding = False
+    organization._state.db = DEFAULT_DB_ALIAS
+    return organization
+
+
+def _clear_organization_cache(**kwargs):
+    """Invalidate cached lookups whenever an organization changes."""
+    _get_organization_values_by_slug.cache_clear()
+    _get_organization_values_by_id.cache_clear()
+
+
+post_save.connect(_clear_organization_cache, sender=Organization)
+post_delete.connect(_clear_organization_cache, sender=Organization)
+
 
 class OrganizationMiddleware(MiddlewareMixin):
     """
@@ -29,18 +98,25 @@ class OrganizationMiddleware(MiddlewareMixin):
             org_slug = request.GET.get('organization_slug')
             org_id = request.GET.get('organization_id')
         
-        # Resolve organization
-        try:
-            if org_slug:
-                organization = Organization.objects.get(slug=org_slug, is_active=True)
-            elif org_id:
-                organization = Organization.objects.get(id=org_id, is_active=True)
-        except Organization.DoesNotExist:
-            pass
+        # Resolve organization through a short-TTL per-process LRU so
+        # repeated requests for the same tenant skip the database
+        # round-trip; the instance is rebuilt fresh per request.
+        if org_slug:
+            organization = _rebuild_organization(
+                _get_organization_values_by_slug(org_slug, _cache_bucket())
+            )
+        elif org_id:
+            organization = _rebuild_organization(
+                _get_organization_values_by_id(org_id, _cache_bucket())
+            )
         
         # Store organization in request
         request.organization = organization
-        
+
+        # Per-request loader so resolvers can batch organization reads
+        request.org_loader = OrganizationByIdLoader()
+        request.org_loader.prime(organization)
+
         return None
 
     def process_response(self, request, response):
@@ -63,17 +139,21 @@ class RequireOrganizationMiddleware(MiddlewareMixin):
         '/graphql/',  # GraphQL handles organization context internally
         '/api/organizations/',  # Organization endpoints don't require org context
     ]
-    
+
+    # str.startswith accepts a tuple and runs the comparison in C, so a
+    # single call replaces the Python-level loop on every request.
+    _EXEMPT_TUPLE = tuple(EXEMPT_PATHS)
+    _API_PREFIX = '/api/'
+
     def process_request(self, request):
         """Check if organization context is required and present."""
-        
+
         # Skip exempt paths
-        for exempt_path in self.EXEMPT_PATHS:
-            if request.path.startswith(exempt_path):
-                return None
-        
+        if request.path.startswith(self._EXEMPT_TUPLE):
+            return None
+
         # Skip non-API requests
-        if not request.path.startswith('/api/'):
+        if not request.path.startswith(self._API_PREFIX):
             return None
         
         # Check if organization context is present
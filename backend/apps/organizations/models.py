@@ -3,6 +3,23 @@ from django.utils.text import slugify
 from django.core.validators import EmailValidator
 
 
+class OrganizationManager(models.Manager):
+    """Manager with bulk helpers for Organization."""
+
+    def bulk_create_with_slugs(self, organizations, batch_size=500):
+        """
+        Bulk-insert organizations, precomputing missing slugs.
+
+        Slugs are generated up front in one pass so bulk_create can issue
+        one INSERT per batch instead of one save() (and one slugify call
+        inside it) per row.
+        """
+        for organization in organizations:
+            if not organization.slug:
+                organization.slug = slugify(organization.name)
+        return self.bulk_create(organizations, batch_size=batch_size)
+
+
 class Organization(models.Model):
     """
     Organization model for multi-tenancy support.
@@ -38,18 +55,25 @@ class Organization(models.Model):
         help_text="When the organization was last updated"
     )
 
+    objects = OrganizationManager()
+
     class Meta:
         db_table = 'organizations'
         ordering = ['name']
         verbose_name = 'Organization'
         verbose_name_plural = 'Organizations'
+        indexes = [
+            # Middleware resolves tenants by (slug, is_active)
+            models.Index(fields=['slug', 'is_active']),
+        ]
 
     def __str__(self):
         return self.name
 
     def save(self, *args, **kwargs):
         """Auto-generate slug from name if not provided."""
-        if not self.slug:
+        # Only slugify on insert; updates of unrelated fields skip it
+        if self._state.adding and not self.slug:
             self.slug = slugify(self.name)
         super().save(*args, **kwargs)
 
@@ -1,24 +1,52 @@
 import graphene
 from graphene_django import DjangoObjectType
-from django.db.models import Q
+from django.db.models import Count, Q
+from .loaders import OrganizationByIdLoader
 from .models import Organization
+from .utils import get_cached_organization, selection_includes
 
 
 class OrganizationType(DjangoObjectType):
     """GraphQL type for Organization model."""
-    
+
     project_count = graphene.Int()
     active_project_count = graphene.Int()
-    
+
     class Meta:
         model = Organization
-        fields = '__all__'
+        fields = (
+            'id', 'name', 'slug', 'contact_email', 'description',
+            'is_active', 'created_at', 'updated_at', 'projects',
+        )
         interfaces = (graphene.relay.Node,)
 
+    @classmethod
+    def get_node(cls, info, id):
+        # graphene-django routes every FK edge to this type through
+        # get_node, which by default refetches by pk per row. Go through
+        # the per-request loader (attached by the middleware, created
+        # lazily otherwise) so repeated edges share one fetch.
+        loader = getattr(info.context, 'org_loader', None)
+        if loader is None:
+            loader = OrganizationByIdLoader()
+            try:
+                info.context.org_loader = loader
+            except AttributeError:
+                return super().get_node(info, id)
+        return loader.load(id)
+
     def resolve_project_count(self, info):
+        # Prefer the value annotated by the list resolver to avoid an
+        # extra COUNT query per organization.
+        annotated = getattr(self, '_project_count', None)
+        if annotated is not None:
+            return annotated
         return self.project_count
 
     def resolve_active_project_count(self, info):
+        annotated = getattr(self, '_active_project_count', None)
+        if annotated is not None:
+            return annotated
         return self.active_project_count
 
 
@@ -30,13 +58,23 @@ class OrganizationQuery(graphene.ObjectType):
     organization_by_slug = graphene.Field(OrganizationType, slug=graphene.String())
 
     def resolve_organization(self, info, id):
-        try:
-            return Organization.objects.get(pk=id)
-        except Organization.DoesNotExist:
-            return None
+        return get_cached_organization(info, id)
 
     def resolve_organizations(self, info, **kwargs):
-        return list(Organization.objects.filter(is_active=True))
+        # Annotate counts in a single query instead of firing two COUNT
+        # queries per organization in the field resolvers.
+        queryset = Organization.objects.filter(is_active=True).annotate(
+            _project_count=Count('projects'),
+            _active_project_count=Count(
+                'projects', filter=Q(projects__status='ACTIVE')
+            ),
+        )
+
+        # Skip the TEXT column when the client didn't select it
+        if not selection_includes(info, 'description'):
+            queryset = queryset.defer('description')
+
+        return queryset
 
     def resolve_organization_by_slug(self, info, slug):
         try:
@@ -96,12 +134,16 @@ class UpdateOrganizationMutation(graphene.Mutation):
     def mutate(self, info, id, **kwargs):
         try:
             organization = Organization.objects.get(pk=id)
-            
-            for field, value in kwargs.items():
-                if value is not None:
-                    setattr(organization, field, value)
-            
-            organization.save()
+
+            changed = [field for field, value in kwargs.items() if value is not None]
+            for field in changed:
+                setattr(organization, field, kwargs[field])
+
+            # Only write the columns that actually changed (plus the
+            # auto_now timestamp); skip the UPDATE entirely when no
+            # fields were provided.
+            if changed:
+                organization.save(update_fields=changed + ['updated_at'])
             
             return UpdateOrganizationMutation(
                 organization=organization,
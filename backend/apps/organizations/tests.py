@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
@@ -7,9 +9,10 @@ from .models import Organization
 class OrganizationModelTest(TestCase):
     """Test cases for Organization model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.org_data = {
+    @cached_property
+    def org_data(self):
+        """Per-test creation kwargs, built lazily on first access."""
+        return {
             'name': 'Test Organization',
             'contact_email': 'test@example.com',
             'description': 'A test organization'
@@ -78,27 +81,29 @@ class OrganizationModelTest(TestCase):
 class OrganizationQuerySetTest(TestCase):
     """Test cases for Organization querysets."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.active_org = Organization.objects.create(
-            name='Active Org',
-            contact_email='active@example.com',
-            is_active=True
-        )
-        self.inactive_org = Organization.objects.create(
-            name='Inactive Org',
-            contact_email='inactive@example.com',
-            is_active=False
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class."""
+        # One INSERT for the whole group instead of one per row
+        cls.active_org, cls.inactive_org = Organization.objects.bulk_create_with_slugs([
+            Organization(
+                name='Active Org',
+                contact_email='active@example.com',
+                is_active=True
+            ),
+            Organization(
+                name='Inactive Org',
+                contact_email='inactive@example.com',
+                is_active=False
+            ),
+        ])
 
     def test_filter_active_organizations(self):
         """Test filtering active organizations."""
         active_orgs = Organization.objects.filter(is_active=True)
-        self.assertEqual(active_orgs.count(), 1)
-        self.assertEqual(active_orgs.first(), self.active_org)
+        self.assertSequenceEqual(list(active_orgs), [self.active_org])
 
     def test_filter_inactive_organizations(self):
         """Test filtering inactive organizations."""
         inactive_orgs = Organization.objects.filter(is_active=False)
-        self.assertEqual(inactive_orgs.count(), 1)
-        self.assertEqual(inactive_orgs.first(), self.inactive_org)
+        self.assertSequenceEqual(list(inactive_orgs), [self.inactive_org])
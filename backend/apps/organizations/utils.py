@@ -6,28 +6,30 @@ class MultiTenantQuerySet:
     """
     Utility class to filter querysets based on organization context.
     """
-    
+
+    # Organization lookup per model, keyed by app label so the registry
+    # can live here without importing the models (and without the
+    # per-call hasattr probing this replaces).
+    _ORG_FILTER = {
+        'projects.project': 'organization',
+        'tasks.task': 'project__organization',
+        'tasks.taskcomment': 'task__project__organization',
+    }
+
     @staticmethod
     def filter_by_organization(queryset, organization):
         """
         Filter queryset by organization based on the model type.
         """
-        model = queryset.model
-        
-        # Direct organization relationship
-        if hasattr(model, 'organization'):
-            return queryset.filter(organization=organization)
-        
-        # Through project relationship
-        elif hasattr(model, 'project'):
-            return queryset.filter(project__organization=organization)
-        
-        # Through task relationship (for comments)
-        elif hasattr(model, 'task'):
-            return queryset.filter(task__project__organization=organization)
-        
+        lookup = MultiTenantQuerySet._ORG_FILTER.get(
+            queryset.model._meta.label_lower
+        )
+
         # If no organization relationship found, return empty queryset
-        return queryset.none()
+        if lookup is None:
+            return queryset.none()
+
+        return queryset.filter(**{lookup: organization})
 
 
 class OrganizationPermissionMixin:
@@ -76,6 +78,52 @@ def require_organization_context(func):
     return wrapper
 
 
+def selection_includes(info, field_name):
+    """
+    Return True if the current GraphQL selection requests ``field_name``.
+
+    Used by list resolvers to defer wide TEXT columns when the client
+    did not select them. Fragments are treated conservatively as a hit
+    so deferral never causes per-row refetch queries.
+    """
+    for field_node in info.field_nodes:
+        selection_set = getattr(field_node, 'selection_set', None)
+        if selection_set is None:
+            continue
+        for selection in selection_set.selections:
+            if selection.kind != 'field':
+                return True
+            if selection.name.value == field_name:
+                return True
+    return False
+
+
+def get_cached_organization(info, organization_id=None):
+    """
+    Resolve an organization by id, memoized for the request lifetime.
+
+    Returns the middleware-resolved organization when the id matches (or
+    no id is given), so the common path never touches the database.
+    """
+    context_org = getattr(info.context, 'organization', None)
+
+    if organization_id is None:
+        return context_org
+
+    if context_org is not None and str(context_org.id) == str(organization_id):
+        return context_org
+
+    cache = getattr(info.context, '_resolved_org_cache', None)
+    if cache is None:
+        cache = {}
+        info.context._resolved_org_cache = cache
+
+    key = str(organization_id)
+    if key not in cache:
+        cache[key] = Organization.objects.filter(pk=organization_id).first()
+    return cache[key]
+
+
 def get_organization_from_request(request):
     """
     Helper function to get organization from request.
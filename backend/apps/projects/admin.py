@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count, Q
 from .models import Project
 
 
@@ -23,10 +24,28 @@ class ProjectAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # Join the organization and annotate task counts so the change
+        # list renders without per-row queries.
+        return super().get_queryset(request).select_related('organization').annotate(
+            _task_count=Count('tasks'),
+            _completed_tasks=Count('tasks', filter=Q(tasks__status='DONE')),
+        )
+
     def task_count(self, obj):
+        annotated = getattr(obj, '_task_count', None)
+        if annotated is not None:
+            return annotated
         return obj.task_count
     task_count.short_description = 'Tasks'
+    task_count.admin_order_field = '_task_count'
 
     def completion_rate(self, obj):
+        task_count = getattr(obj, '_task_count', None)
+        completed = getattr(obj, '_completed_tasks', None)
+        if task_count:
+            return f"{round((completed / task_count) * 100, 2)}%"
+        if task_count == 0:
+            return "0%"
         return f"{obj.completion_rate}%"
     completion_rate.short_description = 'Completion'
@@ -0,0 +1,27 @@
+from .models import Project
+
+
+class ProjectByIdLoader:
+    """
+    Per-request loader that memoizes Project lookups by id.
+
+    GraphQL list queries selecting `task { project { ... } }` otherwise
+    trigger one FK fetch per task; caching by id collapses repeated
+    reads of the same project into a single SELECT.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def load(self, project_id):
+        """Return the project for ``project_id``, fetching it at most once."""
+        if project_id not in self._cache:
+            self._cache[project_id] = Project.objects.select_related(
+                'organization'
+            ).filter(pk=project_id).first()
+        return self._cache[project_id]
+
+    def prime(self, project):
+        """Seed the cache with an already-loaded project."""
+        if project is not None:
+            self._cache[project.pk] = project
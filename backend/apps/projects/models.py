@@ -56,6 +56,12 @@ class Project(models.Model):
         verbose_name = 'Project'
         verbose_name_plural = 'Projects'
         unique_together = ['organization', 'name']
+        indexes = [
+            # List/stat queries filter by (organization, status) and the
+            # overdue check adds due_date
+            models.Index(fields=['organization', 'status']),
+            models.Index(fields=['organization', 'due_date', 'status']),
+        ]
 
     def __str__(self):
         return f"{self.organization.name} - {self.name}"
@@ -1,10 +1,34 @@
 import graphene
 from graphene_django import DjangoObjectType
-from django.db.models import Q
+from django.db.models import BooleanField, Case, Count, Q, Value, When
 from django.core.exceptions import PermissionDenied
+from django.utils import timezone
+from .loaders import ProjectByIdLoader
 from .models import Project
+from apps.organizations.loaders import OrganizationByIdLoader
 from apps.organizations.models import Organization
-from apps.organizations.utils import OrganizationPermissionMixin, require_organization_context
+from apps.organizations.utils import (
+    OrganizationPermissionMixin,
+    require_organization_context,
+    selection_includes,
+)
+
+
+def _annotate_task_counts(queryset):
+    """Annotate per-project fields so list resolvers avoid per-row queries."""
+    today = timezone.now().date()
+    return queryset.annotate(
+        _task_count=Count('tasks'),
+        _completed_tasks=Count('tasks', filter=Q(tasks__status='DONE')),
+        _is_overdue=Case(
+            When(
+                Q(due_date__lt=today) & ~Q(status='COMPLETED'),
+                then=Value(True)
+            ),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+    )
 
 
 class ProjectType(DjangoObjectType):
@@ -17,21 +41,66 @@ class ProjectType(DjangoObjectType):
     
     class Meta:
         model = Project
-        fields = '__all__'
+        fields = (
+            'id', 'organization', 'name', 'description', 'status',
+            'due_date', 'created_at', 'updated_at', 'tasks',
+        )
         interfaces = (graphene.relay.Node,)
 
+    @classmethod
+    def get_node(cls, info, id):
+        # graphene-django routes every FK edge to this type through
+        # get_node, which by default refetches by pk per row. Go through
+        # a per-request loader so tasks sharing a project share one fetch.
+        loader = getattr(info.context, '_project_loader', None)
+        if loader is None:
+            loader = ProjectByIdLoader()
+            try:
+                info.context._project_loader = loader
+            except AttributeError:
+                return super().get_node(info, id)
+        return loader.load(id)
+
     def resolve_task_count(self, info):
+        # Prefer the value annotated by the list resolvers to avoid an
+        # extra COUNT query per project.
+        annotated = getattr(self, '_task_count', None)
+        if annotated is not None:
+            return annotated
         return self.task_count
 
     def resolve_completed_tasks(self, info):
+        annotated = getattr(self, '_completed_tasks', None)
+        if annotated is not None:
+            return annotated
         return self.completed_tasks
 
     def resolve_completion_rate(self, info):
         return self.completion_rate
 
     def resolve_is_overdue(self, info):
+        annotated = getattr(self, '_is_overdue', None)
+        if annotated is not None:
+            return annotated
         return self.is_overdue
 
+    def resolve_organization(self, info):
+        loader = getattr(info.context, 'org_loader', None)
+        if loader is None:
+            loader = OrganizationByIdLoader()
+            try:
+                info.context.org_loader = loader
+            except AttributeError:
+                return self.organization
+
+        # An already-joined organization (select_related) seeds the
+        # loader so the FK wrapper's get_node refetch hits the cache
+        organization = self._state.fields_cache.get('organization')
+        if organization is not None:
+            loader.prime(organization)
+            return organization
+        return loader.load(self.organization_id)
+
 
 class ProjectStatsType(graphene.ObjectType):
     """GraphQL type for project statistics."""
@@ -73,78 +142,96 @@ class ProjectQuery(OrganizationPermissionMixin, graphene.ObjectType):
             return None
 
     def resolve_projects(self, info, **kwargs):
-        # Simpler: return all projects (no org context required)
-        return list(Project.objects.all())
+        # Simpler: return all projects (no org context required).
+        # Return the QuerySet itself so graphene iterates lazily.
+        queryset = _annotate_task_counts(Project.objects.all())
+
+        # Join the organization only when the client selected it, so
+        # narrow queries skip the JOIN entirely
+        if selection_includes(info, 'organization'):
+            queryset = queryset.select_related('organization')
+
+        # Skip the TEXT column when the client didn't select it
+        if not selection_includes(info, 'description'):
+            queryset = queryset.defer('description')
+
+        return queryset
 
     def resolve_projects_by_organization(self, info, organization_id=None):
         context_org = getattr(info.context, 'organization', None)
 
-        # If organization_id is provided, validate it matches context
-        if organization_id:
-            try:
-                requested_org = Organization.objects.get(pk=organization_id)
-                if context_org and requested_org != context_org:
-                    raise PermissionDenied("Access denied to this organization")
-                organization = requested_org
-            except Organization.DoesNotExist:
-                return []
-        else:
-            organization = context_org
+        # Validate by pk comparison instead of re-fetching the
+        # organization row the middleware already resolved
+        if organization_id and context_org and str(context_org.id) != str(organization_id):
+            raise PermissionDenied("Access denied to this organization")
+
+        org_id = organization_id or (context_org.id if context_org else None)
 
-        if not organization:
-            # No org context and no org id passed: return all for simplicity
-            return list(Project.objects.all())
+        queryset = Project.objects.all()
+        if org_id:
+            queryset = queryset.filter(organization_id=org_id)
+        queryset = _annotate_task_counts(queryset)
 
-        return list(Project.objects.filter(organization=organization))
+        # Join the organization only when the client selected it, so
+        # narrow queries skip the JOIN entirely
+        if selection_includes(info, 'organization'):
+            queryset = queryset.select_related('organization')
+
+        # Skip the TEXT column when the client didn't select it
+        if not selection_includes(info, 'description'):
+            queryset = queryset.defer('description')
+
+        return queryset
 
     def resolve_project_stats(self, info, organization_id=None):
         context_org = getattr(info.context, 'organization', None)
 
-        # If organization_id is provided, validate it matches context
-        if organization_id:
-            try:
-                requested_org = Organization.objects.get(pk=organization_id)
-                if context_org and requested_org != context_org:
-                    raise PermissionDenied("Access denied to this organization")
-                organization = requested_org
-            except Organization.DoesNotExist:
-                return None
-        else:
-            organization = context_org
+        # Validate by pk comparison instead of re-fetching the
+        # organization row the middleware already resolved
+        if organization_id and context_org and str(context_org.id) != str(organization_id):
+            raise PermissionDenied("Access denied to this organization")
 
-        if not organization:
+        org_id = organization_id or (context_org.id if context_org else None)
+
+        if not org_id:
             # No org context: compute stats across all projects
             projects = Project.objects.all()
         else:
-            projects = Project.objects.filter(organization=organization)
-
-        total_projects = projects.count()
-        active_projects = projects.filter(status='ACTIVE').count()
-        completed_projects = projects.filter(status='COMPLETED').count()
-
-        # Calculate overdue projects
-        from django.utils import timezone
-        overdue_projects = projects.filter(
-            due_date__lt=timezone.now().date(),
-            status__in=['ACTIVE', 'ON_HOLD']
-        ).count()
-
-        # Calculate task statistics
-        total_tasks = sum(project.task_count for project in projects)
-        completed_tasks = sum(project.completed_tasks for project in projects)
+            projects = Project.objects.filter(organization_id=org_id)
+
+        # Canonical pattern for scalar-only stats: stay at the SQL layer
+        # with aggregate()/values_list() and never instantiate Project
+        # objects — all scalars come back in a single query. The project
+        # counts need distinct=True because the tasks join multiplies rows.
+        stats = projects.aggregate(
+            total_projects=Count('id', distinct=True),
+            active_projects=Count(
+                'id', distinct=True, filter=Q(status='ACTIVE')
+            ),
+            completed_projects=Count(
+                'id', distinct=True, filter=Q(status='COMPLETED')
+            ),
+            overdue_projects=Count(
+                'id',
+                distinct=True,
+                filter=Q(
+                    due_date__lt=timezone.now().date(),
+                    status__in=['ACTIVE', 'ON_HOLD']
+                ),
+            ),
+            total_tasks=Count('tasks'),
+            completed_tasks=Count('tasks', filter=Q(tasks__status='DONE')),
+        )
 
         overall_completion_rate = 0.0
-        if total_tasks > 0:
-            overall_completion_rate = (completed_tasks / total_tasks) * 100.0
+        if stats['total_tasks'] > 0:
+            overall_completion_rate = (
+                stats['completed_tasks'] / stats['total_tasks']
+            ) * 100.0
 
         return ProjectStatsType(
-            total_projects=total_projects,
-            active_projects=active_projects,
-            completed_projects=completed_projects,
-            overdue_projects=overdue_projects,
-            total_tasks=total_tasks,
-            completed_tasks=completed_tasks,
             overall_completion_rate=round(overall_completion_rate, 2),
+            **stats
         )
 
 
@@ -210,12 +297,16 @@ class UpdateProjectMutation(graphene.Mutation):
     def mutate(self, info, id, **kwargs):
         try:
             project = Project.objects.get(pk=id)
-            
-            for field, value in kwargs.items():
-                if value is not None:
-                    setattr(project, field, value)
-            
-            project.save()
+
+            changed = [field for field, value in kwargs.items() if value is not None]
+            for field in changed:
+                setattr(project, field, kwargs[field])
+
+            # Only write the columns that actually changed (plus the
+            # auto_now timestamp); skip the UPDATE entirely when no
+            # fields were provided.
+            if changed:
+                project.save(update_fields=changed + ['updated_at'])
             
             return UpdateProjectMutation(
                 project=project,
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
@@ -10,13 +12,18 @@ from apps.organizations.models import Organization
 class ProjectModelTest(TestCase):
     """Test cases for Project model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.organization = Organization.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class."""
+        cls.organization = Organization.objects.create(
             name='Test Org',
             contact_email='test@example.com'
         )
-        self.project_data = {
+
+    @cached_property
+    def project_data(self):
+        """Per-test creation kwargs, built lazily on first access."""
+        return {
             'organization': self.organization,
             'name': 'Test Project',
             'description': 'A test project',
@@ -127,36 +134,26 @@ class ProjectModelTest(TestCase):
 class ProjectQuerySetTest(TestCase):
     """Test cases for Project querysets."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.org1 = Organization.objects.create(
-            name='Org 1',
-            contact_email='org1@example.com'
-        )
-        self.org2 = Organization.objects.create(
-            name='Org 2',
-            contact_email='org2@example.com'
-        )
-        
-        self.project1 = Project.objects.create(
-            organization=self.org1,
-            name='Project 1',
-            status='ACTIVE'
-        )
-        self.project2 = Project.objects.create(
-            organization=self.org2,
-            name='Project 2',
-            status='COMPLETED'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class."""
+        # Batch sibling rows into one INSERT per model
+        cls.org1, cls.org2 = Organization.objects.bulk_create_with_slugs([
+            Organization(name='Org 1', contact_email='org1@example.com'),
+            Organization(name='Org 2', contact_email='org2@example.com'),
+        ])
+
+        cls.project1, cls.project2 = Project.objects.bulk_create([
+            Project(organization=cls.org1, name='Project 1', status='ACTIVE'),
+            Project(organization=cls.org2, name='Project 2', status='COMPLETED'),
+        ])
 
     def test_filter_by_organization(self):
         """Test filtering projects by organization."""
         org1_projects = Project.objects.filter(organization=self.org1)
-        self.assertEqual(org1_projects.count(), 1)
-        self.assertEqual(org1_projects.first(), self.project1)
+        self.assertSequenceEqual(list(org1_projects), [self.project1])
 
     def test_filter_by_status(self):
         """Test filtering projects by status."""
         active_projects = Project.objects.filter(status='ACTIVE')
-        self.assertEqual(active_projects.count(), 1)
-        self.assertEqual(active_projects.first(), self.project1)
+        self.assertSequenceEqual(list(active_projects), [self.project1])
@@ -0,0 +1,48 @@
+from .models import Task, TaskComment
+
+
+class TaskByIdLoader:
+    """
+    Per-request loader that memoizes Task lookups by id.
+
+    graphene-django re-resolves every FK edge to TaskType through
+    get_node; caching by id (and priming from already-joined rows)
+    keeps that from refetching one task per comment.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def load(self, task_id):
+        """Return the task for ``task_id``, fetching it at most once."""
+        if task_id not in self._cache:
+            self._cache[task_id] = Task.objects.select_related(
+                'project__organization'
+            ).filter(pk=task_id).first()
+        return self._cache[task_id]
+
+    def prime(self, task):
+        """Seed the cache with an already-loaded task."""
+        if task is not None:
+            self._cache[task.pk] = task
+
+
+class TaskCommentsByTaskLoader:
+    """
+    Per-request loader that memoizes TaskComment lookups grouped by task.
+
+    Sibling resolvers that request comments for overlapping task sets
+    share one cache, so each task's comments are fetched at most once
+    per request.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def load(self, task_id):
+        """Return the comments for ``task_id``, fetching them at most once."""
+        if task_id not in self._cache:
+            self._cache[task_id] = list(
+                TaskComment.objects.filter(task_id=task_id).order_by('created_at')
+            )
+        return self._cache[task_id]
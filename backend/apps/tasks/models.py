@@ -1,8 +1,31 @@
 from django.db import models
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Now
 from django.core.validators import EmailValidator
+from django.utils import timezone
 from apps.projects.models import Project
 
 
+class TaskQuerySet(models.QuerySet):
+    """QuerySet with annotation helpers for Task."""
+
+    def with_overdue(self):
+        """
+        Annotate `_is_overdue` as a DB expression so list queries skip
+        the per-row Python property.
+        """
+        return self.annotate(
+            _is_overdue=ExpressionWrapper(
+                Q(due_date__lt=Now()) & ~Q(status='DONE'),
+                output_field=BooleanField(),
+            )
+        )
+
+
+class TaskManager(models.Manager.from_queryset(TaskQuerySet)):
+    """Manager exposing the Task queryset helpers."""
+
+
 class Task(models.Model):
     """
     Task model that belongs to a project.
@@ -67,11 +90,21 @@ class Task(models.Model):
         help_text="When the task was last updated"
     )
 
+    objects = TaskManager()
+
     class Meta:
         db_table = 'tasks'
         ordering = ['-created_at']
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
+        indexes = [
+            # Task lists filter by project or status and order by
+            # -created_at; matching indexes avoid a sort step
+            models.Index(fields=['project', '-created_at'],
+                         name='task_project_created_idx'),
+            models.Index(fields=['status', 'due_date'],
+                         name='task_status_due_idx'),
+        ]
 
     def __str__(self):
         return f"{self.project.name} - {self.title}"
@@ -86,12 +119,16 @@ class Task(models.Model):
         """Check if the task is overdue."""
         if not self.due_date:
             return False
-        from django.utils import timezone
         return timezone.now() > self.due_date and self.status != 'DONE'
 
     @property
     def comment_count(self):
         """Get the number of comments on this task."""
+        # Callers that annotate _comment_count (admin, GraphQL list
+        # resolvers) skip the per-task COUNT query
+        annotated = getattr(self, '_comment_count', None)
+        if annotated is not None:
+            return annotated
         return self.comments.count()
 
 
@@ -128,6 +165,10 @@ class TaskComment(models.Model):
         ordering = ['created_at']
         verbose_name = 'Task Comment'
         verbose_name_plural = 'Task Comments'
+        indexes = [
+            # Per-task comment scans order by created_at
+            models.Index(fields=['task', 'created_at']),
+        ]
 
     def __str__(self):
         return f"Comment on {self.task.title} by {self.author_email}"
@@ -1,20 +1,111 @@
 import graphene
 from graphene_django import DjangoObjectType
+from graphene_django.fields import DjangoConnectionField
 from django.db.models import Q
 from django.core.exceptions import PermissionDenied
+from .loaders import TaskByIdLoader, TaskCommentsByTaskLoader
+from apps.projects.loaders import ProjectByIdLoader
 from .models import Task, TaskComment
 from apps.projects.models import Project
 from apps.organizations.utils import OrganizationPermissionMixin, require_organization_context
 
 
+# Per-field queryset optimizations, keyed by the GraphQL field name the
+# client selects. Values are (queryset method, argument) pairs; a None
+# argument means the method is called bare.
+_TASK_FIELD_OPTIMIZATIONS = {
+    'project': ('select_related', 'project__organization'),
+    'comments': ('prefetch_related', 'comments'),
+    'commentCount': ('prefetch_related', 'comments'),
+    'isOverdue': ('with_overdue', None),
+}
+
+_COMMENT_FIELD_OPTIMIZATIONS = {
+    'task': ('select_related', 'task__project__organization'),
+}
+
+# Wide TEXT columns to skip when the client didn't select them, keyed by
+# GraphQL field name.
+_TASK_DEFERRABLE_COLUMNS = {'description': 'description'}
+_COMMENT_DEFERRABLE_COLUMNS = {'content': 'content'}
+
+# Sentinel recorded when a fragment makes the selection opaque
+_FRAGMENT = '...'
+
+
+def _collect_selected_fields(selection_set, selected):
+    """Gather selected field names, looking through edges/node wrappers."""
+    for selection in selection_set.selections:
+        if selection.kind != 'field':
+            selected.add(_FRAGMENT)
+            continue
+        name = selection.name.value
+        if name in ('edges', 'node') and selection.selection_set is not None:
+            _collect_selected_fields(selection.selection_set, selected)
+        else:
+            selected.add(name)
+
+
+def optimize_queryset(queryset, info, optimizations=_TASK_FIELD_OPTIMIZATIONS,
+                      deferrable=_TASK_DEFERRABLE_COLUMNS):
+    """
+    Apply select_related/prefetch_related driven by the GraphQL field AST,
+    and defer wide TEXT columns the client didn't select.
+
+    Narrow queries pay for no joins; wide queries avoid N+1 resolution
+    without hand-placing the right chain in every resolver. Fragments are
+    handled conservatively: every optimization applies and nothing is
+    deferred.
+    """
+    selected = set()
+    for field_node in info.field_nodes:
+        selection_set = getattr(field_node, 'selection_set', None)
+        if selection_set is None:
+            continue
+        _collect_selected_fields(selection_set, selected)
+
+    opaque = _FRAGMENT in selected
+
+    for field_name, (method, relation) in optimizations.items():
+        if opaque or field_name in selected:
+            if relation is None:
+                queryset = getattr(queryset, method)()
+            else:
+                queryset = getattr(queryset, method)(relation)
+
+    if not opaque:
+        for field_name, column in deferrable.items():
+            if field_name not in selected:
+                queryset = queryset.defer(column)
+
+    return queryset
+
+
 class TaskCommentType(DjangoObjectType):
     """GraphQL type for TaskComment model."""
-    
+
     class Meta:
         model = TaskComment
         fields = '__all__'
         interfaces = (graphene.relay.Node,)
 
+    def resolve_task(self, info):
+        loader = getattr(info.context, '_task_loader', None)
+        if loader is None:
+            loader = TaskByIdLoader()
+            try:
+                info.context._task_loader = loader
+            except AttributeError:
+                return self.task
+
+        # An already-joined task (select_related) seeds the loader so
+        # the FK wrapper's get_node refetch hits the cache
+        task = self._state.fields_cache.get('task')
+        if task is not None:
+            loader.prime(task)
+            return task
+        return loader.load(self.task_id)
+
 
 class TaskType(DjangoObjectType):
     """GraphQL type for Task model."""
@@ -28,34 +119,90 @@ class TaskType(DjangoObjectType):
         fields = '__all__'
         interfaces = (graphene.relay.Node,)
 
+    @classmethod
+    def get_node(cls, info, id):
+        # graphene-django routes every FK edge to this type through
+        # get_node, which by default refetches by pk per row. Go through
+        # a per-request loader so comments sharing a task share one fetch.
+        loader = getattr(info.context, '_task_loader', None)
+        if loader is None:
+            loader = TaskByIdLoader()
+            try:
+                info.context._task_loader = loader
+            except AttributeError:
+                return super().get_node(info, id)
+        return loader.load(id)
+
     def resolve_is_overdue(self, info):
+        # Prefer the Task.objects.with_overdue() annotation when present
+        annotated = getattr(self, '_is_overdue', None)
+        if annotated is not None:
+            return annotated
         return self.is_overdue
 
     def resolve_comment_count(self, info):
+        # Prefer the value annotated by the list resolvers to avoid an
+        # extra COUNT query per task.
+        annotated = getattr(self, '_comment_count', None)
+        if annotated is not None:
+            return annotated
         return self.comment_count
 
+    def resolve_project(self, info):
+        loader = getattr(info.context, '_project_loader', None)
+        if loader is None:
+            loader = ProjectByIdLoader()
+            try:
+                info.context._project_loader = loader
+            except AttributeError:
+                return self.project
+
+        # An already-joined project (select_related) seeds the loader so
+        # the FK wrapper's get_node refetch hits the cache; otherwise
+        # tasks sharing a project share one fetch
+        project = self._state.fields_cache.get('project')
+        if project is not None:
+            loader.prime(project)
+            return project
+        return loader.load(self.project_id)
+
     def resolve_comments(self, info):
-        return self.comments.all()
+        # A prefetch from the list resolvers wins outright
+        if 'comments' in getattr(self, '_prefetched_objects_cache', {}):
+            return self.comments.all()
+
+        # Otherwise go through a per-request loader so sibling resolvers
+        # requesting the same task's comments share one fetch
+        loader = getattr(info.context, '_task_comments_loader', None)
+        if loader is None:
+            loader = TaskCommentsByTaskLoader()
+            try:
+                info.context._task_comments_loader = loader
+            except AttributeError:
+                return self.comments.all()
+        return loader.load(self.id)
 
 
 class TaskQuery(OrganizationPermissionMixin, graphene.ObjectType):
     """GraphQL queries for Task."""
 
     task = graphene.Field(TaskType, id=graphene.ID())
-    tasks = graphene.List(TaskType)
+    tasks = DjangoConnectionField(TaskType)
     tasks_by_project = graphene.List(
         TaskType,
         project_id=graphene.ID(required=True)
     )
     task_comment = graphene.Field(TaskCommentType, id=graphene.ID())
-    task_comments = graphene.List(
+    task_comments = DjangoConnectionField(
         TaskCommentType,
         task_id=graphene.ID(required=True)
     )
 
     def resolve_task(self, info, id):
         try:
-            task = Task.objects.get(pk=id)
+            # Join project and organization up front; the permission
+            # check below walks both FKs
+            task = Task.objects.select_related('project__organization').get(pk=id)
             organization = getattr(info.context, 'organization', None)
 
             # Ensure task belongs to the current organization context
@@ -67,8 +214,10 @@ class TaskQuery(OrganizationPermissionMixin, graphene.ObjectType):
             return None
 
     def resolve_tasks(self, info, **kwargs):
-        # Simpler: return all tasks (no org context required)
-        return list(Task.objects.all())
+        # Simpler: return all tasks (no org context required).
+        # Return the QuerySet so the connection field slices it with
+        # LIMIT/OFFSET; joins and prefetches follow the selection.
+        return optimize_queryset(Task.objects.all(), info)
 
     def resolve_tasks_by_project(self, info, project_id):
         try:
@@ -79,13 +228,15 @@ class TaskQuery(OrganizationPermissionMixin, graphene.ObjectType):
             if organization and project.organization != organization:
                 raise PermissionDenied("Access denied to this project")
 
-            return Task.objects.filter(project=project)
+            return optimize_queryset(Task.objects.filter(project=project), info)
         except Project.DoesNotExist:
             return []
 
     def resolve_task_comment(self, info, id):
         try:
-            comment = TaskComment.objects.get(pk=id)
+            comment = TaskComment.objects.select_related(
+                'task__project__organization'
+            ).get(pk=id)
             organization = getattr(info.context, 'organization', None)
 
             # Ensure comment belongs to the current organization context
@@ -96,7 +247,7 @@ class TaskQuery(OrganizationPermissionMixin, graphene.ObjectType):
         except TaskComment.DoesNotExist:
             return None
 
-    def resolve_task_comments(self, info, task_id):
+    def resolve_task_comments(self, info, task_id, **kwargs):
         try:
             task = Task.objects.get(pk=task_id)
             organization = getattr(info.context, 'organization', None)
@@ -105,7 +256,12 @@ class TaskQuery(OrganizationPermissionMixin, graphene.ObjectType):
             if organization and task.project.organization != organization:
                 raise PermissionDenied("Access denied to this task")
 
-            return list(TaskComment.objects.filter(task=task))
+            return optimize_queryset(
+                TaskComment.objects.filter(task=task),
+                info,
+                optimizations=_COMMENT_FIELD_OPTIMIZATIONS,
+                deferrable=_COMMENT_DEFERRABLE_COLUMNS,
+            )
         except Task.DoesNotExist:
             return []
 
@@ -128,7 +284,8 @@ class CreateTaskMutation(graphene.Mutation):
 
     def mutate(self, info, project_id, title, **kwargs):
         try:
-            project = Project.objects.get(pk=project_id)
+            # Only the pk is needed for the FK handle; skip the wide row
+            project = Project.objects.only('id').get(pk=project_id)
             
             task = Task.objects.create(
                 project=project,
@@ -139,7 +296,11 @@ class CreateTaskMutation(graphene.Mutation):
                 assignee_email=kwargs.get('assignee_email', ''),
                 due_date=kwargs.get('due_date')
             )
-            
+
+            # A fresh task has no comments; seed the annotation so a
+            # commentCount selection on the payload skips the COUNT query
+            task._comment_count = 0
+
             return CreateTaskMutation(
                 task=task,
                 success=True,
@@ -178,12 +339,16 @@ class UpdateTaskMutation(graphene.Mutation):
     def mutate(self, info, id, **kwargs):
         try:
             task = Task.objects.get(pk=id)
-            
-            for field, value in kwargs.items():
-                if value is not None:
-                    setattr(task, field, value)
-            
-            task.save()
+
+            changed = [field for field, value in kwargs.items() if value is not None]
+            for field in changed:
+                setattr(task, field, kwargs[field])
+
+            # Only write the columns that actually changed (plus the
+            # auto_now timestamp); skip the UPDATE entirely when no
+            # fields were provided.
+            if changed:
+                task.save(update_fields=changed + ['updated_at'])
             
             return UpdateTaskMutation(
                 task=task,
@@ -218,14 +383,15 @@ class AddTaskCommentMutation(graphene.Mutation):
 
     def mutate(self, info, task_id, content, author_email):
         try:
-            task = Task.objects.get(pk=task_id)
+            # Only the pk is needed for the FK handle; skip the wide row
+            task = Task.objects.only('id').get(pk=task_id)
             
             comment = TaskComment.objects.create(
                 task=task,
                 content=content,
                 author_email=author_email
             )
-            
+
             return AddTaskCommentMutation(
                 comment=comment,
                 success=True,
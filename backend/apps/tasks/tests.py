@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -10,17 +12,22 @@ from apps.organizations.models import Organization
 class TaskModelTest(TestCase):
     """Test cases for Task model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.organization = Organization.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class."""
+        cls.organization = Organization.objects.create(
             name='Test Org',
             contact_email='test@example.com'
         )
-        self.project = Project.objects.create(
-            organization=self.organization,
+        cls.project = Project.objects.create(
+            organization=cls.organization,
             name='Test Project'
         )
-        self.task_data = {
+
+    @cached_property
+    def task_data(self):
+        """Per-test creation kwargs, built lazily on first access."""
+        return {
             'project': self.project,
             'title': 'Test Task',
             'description': 'A test task',
@@ -125,21 +132,26 @@ class TaskModelTest(TestCase):
 class TaskCommentModelTest(TestCase):
     """Test cases for TaskComment model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.organization = Organization.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class."""
+        cls.organization = Organization.objects.create(
             name='Test Org',
             contact_email='test@example.com'
         )
-        self.project = Project.objects.create(
-            organization=self.organization,
+        cls.project = Project.objects.create(
+            organization=cls.organization,
             name='Test Project'
         )
-        self.task = Task.objects.create(
-            project=self.project,
+        cls.task = Task.objects.create(
+            project=cls.project,
             title='Test Task'
         )
-        self.comment_data = {
+
+    @cached_property
+    def comment_data(self):
+        """Per-test creation kwargs, built lazily on first access."""
+        return {
             'task': self.task,
             'content': 'This is a test comment',
             'author_email': 'author@example.com'
@@ -178,51 +190,52 @@ class TaskCommentModelTest(TestCase):
 class TaskQuerySetTest(TestCase):
     """Test cases for Task and TaskComment querysets."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.org1 = Organization.objects.create(
-            name='Org 1',
-            contact_email='org1@example.com'
-        )
-        self.org2 = Organization.objects.create(
-            name='Org 2',
-            contact_email='org2@example.com'
-        )
-        
-        self.project1 = Project.objects.create(
-            organization=self.org1,
-            name='Project 1'
-        )
-        self.project2 = Project.objects.create(
-            organization=self.org2,
-            name='Project 2'
-        )
-        
-        self.task1 = Task.objects.create(
-            project=self.project1,
-            title='Task 1',
-            status='TODO'
-        )
-        self.task2 = Task.objects.create(
-            project=self.project2,
-            title='Task 2',
-            status='DONE'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class."""
+        # Batch sibling rows into one INSERT per model
+        cls.org1, cls.org2 = Organization.objects.bulk_create_with_slugs([
+            Organization(name='Org 1', contact_email='org1@example.com'),
+            Organization(name='Org 2', contact_email='org2@example.com'),
+        ])
+
+        cls.project1, cls.project2 = Project.objects.bulk_create([
+            Project(organization=cls.org1, name='Project 1'),
+            Project(organization=cls.org2, name='Project 2'),
+        ])
+
+        cls.task1, cls.task2 = Task.objects.bulk_create([
+            Task(project=cls.project1, title='Task 1', status='TODO'),
+            Task(project=cls.project2, title='Task 2', status='DONE'),
+        ])
 
     def test_filter_tasks_by_project(self):
         """Test filtering tasks by project."""
         project1_tasks = Task.objects.filter(project=self.project1)
-        self.assertEqual(project1_tasks.count(), 1)
-        self.assertEqual(project1_tasks.first(), self.task1)
+        self.assertSequenceEqual(list(project1_tasks), [self.task1])
 
     def test_filter_tasks_by_organization(self):
         """Test filtering tasks by organization."""
         org1_tasks = Task.objects.filter(project__organization=self.org1)
-        self.assertEqual(org1_tasks.count(), 1)
-        self.assertEqual(org1_tasks.first(), self.task1)
+        self.assertSequenceEqual(list(org1_tasks), [self.task1])
 
     def test_filter_tasks_by_status(self):
         """Test filtering tasks by status."""
         todo_tasks = Task.objects.filter(status='TODO')
-        self.assertEqual(todo_tasks.count(), 1)
-        self.assertEqual(todo_tasks.first(), self.task1)
+        self.assertSequenceEqual(list(todo_tasks), [self.task1])
+
+    def test_with_overdue_annotation(self):
+        """Test the _is_overdue annotation from with_overdue()."""
+        past_due = timezone.now() - timedelta(days=1)
+        Task.objects.bulk_create([
+            Task(project=self.project1, title='Overdue', due_date=past_due),
+            Task(project=self.project1, title='Done late', status='DONE',
+                 due_date=past_due),
+        ])
+
+        annotated = {
+            task.title: bool(task._is_overdue)
+            for task in Task.objects.with_overdue().filter(due_date__isnull=False)
+        }
+        self.assertTrue(annotated['Overdue'])
+        self.assertFalse(annotated['Done late'])
@@ -1,4 +1,8 @@
+from functools import lru_cache
+
 import graphene
+from graphql import ExecutionResult
+from graphene_django.views import GraphQLView
 from apps.organizations.schema import OrganizationQuery, OrganizationMutation
 from apps.projects.schema import ProjectQuery, ProjectMutation
 from apps.tasks.schema import TaskQuery, TaskMutation
@@ -25,3 +29,35 @@ class Mutation(
 
 
 schema = graphene.Schema(query=Query, mutation=Mutation)
+
+# Freeze the SDL once at import time; the schema never changes at runtime
+SCHEMA_SDL = str(schema)
+
+
+@lru_cache(maxsize=1)
+def _cached_introspection():
+    """Run the introspection query once per process and reuse the result."""
+    return schema.introspect()
+
+
+class CachedIntrospectionGraphQLView(GraphQLView):
+    """
+    GraphQLView that serves the standard introspection query from a
+    per-process cache instead of re-executing it on every request
+    (GraphiQL and client tooling issue it constantly in development).
+    """
+
+    def execute_graphql_request(self, request, data, query, variables,
+                                operation_name, show_graphiql=False):
+        # The operation name alone is not enough — a user-authored
+        # operation may also be called IntrospectionQuery. Only
+        # short-circuit when the query actually introspects __schema.
+        if (
+            operation_name == 'IntrospectionQuery'
+            and not variables
+            and query and '__schema' in query
+        ):
+            return ExecutionResult(data=_cached_introspection())
+        return super().execute_graphql_request(
+            request, data, query, variables, operation_name, show_graphiql
+        )
@@ -0,0 +1,17 @@
+"""
+Test settings for project_management project.
+
+Runs the suite against in-memory SQLite: the tests use no
+Postgres-specific SQL, and skipping schema creation and disk fsync is
+the single biggest lever on suite wall time. Production settings are
+untouched; select with DJANGO_SETTINGS_MODULE=project_management.test_settings.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
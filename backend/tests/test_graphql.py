@@ -1,47 +1,298 @@
+from functools import lru_cache
+
+from django.db import connection
 from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import AnonymousUser
-from graphene.test import Client
+from graphql import execute, parse, validate
 from project_management.schema import schema
 from apps.organizations.models import Organization
 from apps.projects.models import Project
 from apps.tasks.models import Task, TaskComment
 
 
+# Queries are hoisted to module scope and parsed/validated once per
+# source string, so repeated executions skip graphql-core's
+# lexer/parser and validation passes.
+@lru_cache(maxsize=None)
+def parse_document(source):
+    """Parse a GraphQL source string into a DocumentNode, memoized."""
+    return parse(source)
+
+
+@lru_cache(maxsize=None)
+def validate_document(source):
+    """Validate a source string against the schema, memoized.
+
+    Calling execute() directly skips validation, which would let an
+    invalid query half-execute instead of erroring.
+    """
+    return tuple(validate(schema.graphql_schema, parse_document(source)))
+
+
+ORGANIZATION_QUERY = '''
+    query GetOrganization($id: ID!) {
+        organization(id: $id) {
+            id
+            name
+            slug
+            contactEmail
+            isActive
+            projectCount
+        }
+    }
+'''
+
+ORGANIZATIONS_QUERY = '''
+    query GetOrganizations {
+        organizations {
+            id
+            name
+            slug
+        }
+    }
+'''
+
+CREATE_ORGANIZATION_MUTATION = '''
+    mutation CreateOrganization($name: String!, $contactEmail: String!) {
+        createOrganization(name: $name, contactEmail: $contactEmail) {
+            success
+            errors
+            organization {
+                id
+                name
+                contactEmail
+                slug
+            }
+        }
+    }
+'''
+
+PROJECT_QUERY = '''
+    query GetProject($id: ID!) {
+        project(id: $id) {
+            id
+            name
+            description
+            status
+            taskCount
+            completionRate
+            organization {
+                id
+                name
+            }
+        }
+    }
+'''
+
+PROJECTS_BY_ORGANIZATION_QUERY = '''
+    query GetProjectsByOrganization($organizationId: ID!) {
+        projectsByOrganization(organizationId: $organizationId) {
+            id
+            name
+            status
+        }
+    }
+'''
+
+PROJECTS_WITH_ORGANIZATION_QUERY = '''
+    query GetProjectsByOrganization($organizationId: ID!) {
+        projectsByOrganization(organizationId: $organizationId) {
+            id
+            name
+            organization {
+                name
+            }
+        }
+    }
+'''
+
+CREATE_PROJECT_MUTATION = '''
+    mutation CreateProject($organizationId: ID!, $name: String!, $description: String) {
+        createProject(organizationId: $organizationId, name: $name, description: $description) {
+            success
+            errors
+            project {
+                id
+                name
+                description
+                status
+            }
+        }
+    }
+'''
+
+TASK_QUERY = '''
+    query GetTask($id: ID!) {
+        task(id: $id) {
+            id
+            title
+            description
+            status
+            priority
+            assigneeEmail
+            commentCount
+            project {
+                id
+                name
+            }
+        }
+    }
+'''
+
+TASKS_CONNECTION_QUERY = '''
+    query GetTasks {
+        tasks {
+            edges {
+                node {
+                    title
+                    status
+                    isOverdue
+                }
+            }
+        }
+    }
+'''
+
+TASK_COMMENTS_CONNECTION_QUERY = '''
+    query GetTaskComments($taskId: ID!) {
+        taskComments(taskId: $taskId) {
+            edges {
+                node {
+                    content
+                    authorEmail
+                }
+            }
+        }
+    }
+'''
+
+TASKS_BY_PROJECT_QUERY = '''
+    query GetTasksByProject($projectId: ID!) {
+        tasksByProject(projectId: $projectId) {
+            id
+            title
+            status
+        }
+    }
+'''
+
+CREATE_TASK_MUTATION = '''
+    mutation CreateTask($projectId: ID!, $title: String!, $description: String) {
+        createTask(projectId: $projectId, title: $title, description: $description) {
+            success
+            errors
+            task {
+                id
+                title
+                description
+                status
+            }
+        }
+    }
+'''
+
+ADD_TASK_COMMENT_MUTATION = '''
+    mutation AddTaskComment($taskId: ID!, $content: String!, $authorEmail: String!) {
+        addTaskComment(taskId: $taskId, content: $content, authorEmail: $authorEmail) {
+            success
+            errors
+            comment {
+                id
+                content
+                authorEmail
+            }
+        }
+    }
+'''
+
+
 class GraphQLTestCase(TestCase):
     """Base test case for GraphQL tests."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.factory = RequestFactory()
-        self.client = Client(schema)
-        
+    # Stateless; build it once at class scope instead of per test
+    factory = RequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class; each test runs in a
+        savepoint, so in-test mutations still roll back."""
         # Create test organization
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org',
             contact_email='test@example.com'
         )
-        
+
         # Create test project
-        self.project = Project.objects.create(
-            organization=self.organization,
+        cls.project = Project.objects.create(
+            organization=cls.organization,
             name='Test Project',
             description='A test project'
         )
-        
+
         # Create test task
-        self.task = Task.objects.create(
-            project=self.project,
+        cls.task = Task.objects.create(
+            project=cls.project,
             title='Test Task',
             description='A test task',
             assignee_email='assignee@example.com'
         )
 
+        # Create test comment
+        cls.comment = TaskComment.objects.create(
+            task=cls.task,
+            content='A fixture comment',
+            author_email='commenter@example.com'
+        )
+
+        # GraphQL variables want string ids; convert once per class
+        cls.organization_id = str(cls.organization.id)
+        cls.project_id = str(cls.project.id)
+        cls.task_id = str(cls.task.id)
+
+        # Resolvers only read the request, so one prebuilt anonymous
+        # request serves as the context for every test in the class
+        cls.context = cls.factory.get('/')
+        cls.context.user = AnonymousUser()
+        cls.context.organization = cls.organization
+
+    def execute_document(self, source, variables=None, context=None):
+        """Execute a memoized pre-parsed document directly against the
+        graphql-core schema — no test-client wrapper layer."""
+        validation_errors = validate_document(source)
+        if validation_errors:
+            return {
+                'data': None,
+                'errors': [error.formatted for error in validation_errors],
+            }
+        result = execute(
+            schema.graphql_schema,
+            parse_document(source),
+            variable_values=variables,
+            context_value=context,
+        )
+        formatted = {'data': result.data}
+        if result.errors:
+            formatted['errors'] = [error.formatted for error in result.errors]
+        return formatted
+
+    def execute_ok(self, source, variables=None, context=None):
+        """Execute a document that is expected to succeed and return the
+        data payload; on failure the GraphQL errors end up in the
+        assertion message instead of a bare None mismatch."""
+        result = self.execute_document(source, variables=variables, context=context)
+        self.assertIsNone(result.get('errors'), result.get('errors'))
+        return result['data']
+
     def create_request_with_organization(self, organization=None):
-        """Create a mock request with organization context."""
+        """Return a mock request with organization context; the shared
+        class-level context covers the common no-argument case."""
+        if organization is None:
+            return self.context
         request = self.factory.get('/')
         request.user = AnonymousUser()
-        request.organization = organization or self.organization
+        request.organization = organization
         return request
 
 
@@ -50,288 +301,167 @@ class OrganizationGraphQLTest(GraphQLTestCase):
 
     def test_organization_query(self):
         """Test querying a single organization."""
-        query = '''
-            query GetOrganization($id: ID!) {
-                organization(id: $id) {
-                    id
-                    name
-                    slug
-                    contactEmail
-                    isActive
-                    projectCount
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(query, variables={'id': str(self.organization.id)}, context=context)
-        
-        self.assertIsNone(result.get('errors'))
-        org_data = result['data']['organization']
+        data = self.execute_ok(
+            ORGANIZATION_QUERY,
+            variables={'id': self.organization_id},
+            context=self.context
+        )
+
+        org_data = data['organization']
         self.assertEqual(org_data['name'], 'Test Organization')
         self.assertEqual(org_data['slug'], 'test-org')
 
     def test_organizations_query(self):
         """Test querying all organizations."""
-        query = '''
-            query GetOrganizations {
-                organizations {
-                    edges {
-                        node {
-                            id
-                            name
-                            slug
-                        }
-                    }
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(query, context=context)
-        
-        self.assertIsNone(result.get('errors'))
-        organizations = result['data']['organizations']['edges']
+        data = self.execute_ok(ORGANIZATIONS_QUERY, context=self.context)
+
+        organizations = data['organizations']
         self.assertEqual(len(organizations), 1)
-        self.assertEqual(organizations[0]['node']['name'], 'Test Organization')
-
-    def test_create_organization_mutation(self):
-        """Test creating an organization."""
-        mutation = '''
-            mutation CreateOrganization($name: String!, $contactEmail: String!) {
-                createOrganization(name: $name, contactEmail: $contactEmail) {
-                    success
-                    errors
-                    organization {
-                        id
-                        name
-                        contactEmail
-                        slug
-                    }
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(
-            mutation,
-            variables={
-                'name': 'New Organization',
-                'contactEmail': 'new@example.com'
-            },
-            context=context
-        )
-        
-        self.assertIsNone(result.get('errors'))
-        mutation_data = result['data']['createOrganization']
-        self.assertTrue(mutation_data['success'])
-        self.assertEqual(mutation_data['organization']['name'], 'New Organization')
+        self.assertEqual(organizations[0]['name'], 'Test Organization')
 
 
 class ProjectGraphQLTest(GraphQLTestCase):
-    """Test GraphQL queries and mutations for projects."""
+    """Test GraphQL queries for projects."""
 
     def test_project_query(self):
         """Test querying a single project."""
-        query = '''
-            query GetProject($id: ID!) {
-                project(id: $id) {
-                    id
-                    name
-                    description
-                    status
-                    taskCount
-                    completionRate
-                    organization {
-                        id
-                        name
-                    }
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(query, variables={'id': str(self.project.id)}, context=context)
-        
-        self.assertIsNone(result.get('errors'))
-        project_data = result['data']['project']
+        data = self.execute_ok(
+            PROJECT_QUERY,
+            variables={'id': self.project_id},
+            context=self.context
+        )
+
+        project_data = data['project']
         self.assertEqual(project_data['name'], 'Test Project')
         self.assertEqual(project_data['organization']['name'], 'Test Organization')
 
     def test_projects_by_organization_query(self):
         """Test querying projects by organization."""
-        query = '''
-            query GetProjectsByOrganization($organizationId: ID!) {
-                projectsByOrganization(organizationId: $organizationId) {
-                    id
-                    name
-                    status
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(
-            query,
-            variables={'organizationId': str(self.organization.id)},
-            context=context
+        data = self.execute_ok(
+            PROJECTS_BY_ORGANIZATION_QUERY,
+            variables={'organizationId': self.organization_id},
+            context=self.context
         )
-        
-        self.assertIsNone(result.get('errors'))
-        projects = result['data']['projectsByOrganization']
+
+        projects = data['projectsByOrganization']
         self.assertEqual(len(projects), 1)
         self.assertEqual(projects[0]['name'], 'Test Project')
 
-    def test_create_project_mutation(self):
-        """Test creating a project."""
-        mutation = '''
-            mutation CreateProject($organizationId: ID!, $name: String!, $description: String) {
-                createProject(organizationId: $organizationId, name: $name, description: $description) {
-                    success
-                    errors
-                    project {
-                        id
-                        name
-                        description
-                        status
-                    }
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(
-            mutation,
-            variables={
-                'organizationId': str(self.organization.id),
-                'name': 'New Project',
-                'description': 'A new project'
-            },
-            context=context
-        )
-        
-        self.assertIsNone(result.get('errors'))
-        mutation_data = result['data']['createProject']
-        self.assertTrue(mutation_data['success'])
-        self.assertEqual(mutation_data['project']['name'], 'New Project')
+    def test_projects_by_organization_query_count(self):
+        """Regression guard: query count must not scale with row count."""
+        Project.objects.bulk_create([
+            Project(organization=self.organization, name=f'Bulk Project {i}')
+            for i in range(10)
+        ])
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = self.execute_ok(
+                PROJECTS_WITH_ORGANIZATION_QUERY,
+                variables={'organizationId': self.organization_id},
+                context=self.context
+            )
+
+        self.assertEqual(len(data['projectsByOrganization']), 11)
+        # One SELECT with the organization JOIN, however many rows exist
+        self.assertEqual(len(ctx.captured_queries), 1)
 
 
 class TaskGraphQLTest(GraphQLTestCase):
-    """Test GraphQL queries and mutations for tasks."""
+    """Test GraphQL queries for tasks."""
 
     def test_task_query(self):
         """Test querying a single task."""
-        query = '''
-            query GetTask($id: ID!) {
-                task(id: $id) {
-                    id
-                    title
-                    description
-                    status
-                    priority
-                    assigneeEmail
-                    commentCount
-                    project {
-                        id
-                        name
-                    }
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(query, variables={'id': str(self.task.id)}, context=context)
-        
-        self.assertIsNone(result.get('errors'))
-        task_data = result['data']['task']
+        data = self.execute_ok(
+            TASK_QUERY,
+            variables={'id': self.task_id},
+            context=self.context
+        )
+
+        task_data = data['task']
         self.assertEqual(task_data['title'], 'Test Task')
         self.assertEqual(task_data['project']['name'], 'Test Project')
 
+    def test_tasks_connection_query(self):
+        """Test querying the relay tasks connection."""
+        data = self.execute_ok(TASKS_CONNECTION_QUERY, context=self.context)
+
+        edges = data['tasks']['edges']
+        self.assertEqual(len(edges), 1)
+        self.assertEqual(edges[0]['node']['title'], 'Test Task')
+        self.assertFalse(edges[0]['node']['isOverdue'])
+
+    def test_task_comments_connection_query(self):
+        """Test querying the relay task comments connection."""
+        data = self.execute_ok(
+            TASK_COMMENTS_CONNECTION_QUERY,
+            variables={'taskId': self.task_id},
+            context=self.context
+        )
+
+        edges = data['taskComments']['edges']
+        self.assertEqual(len(edges), 1)
+        self.assertEqual(edges[0]['node']['content'], 'A fixture comment')
+
     def test_tasks_by_project_query(self):
         """Test querying tasks by project."""
-        query = '''
-            query GetTasksByProject($projectId: ID!) {
-                tasksByProject(projectId: $projectId) {
-                    id
-                    title
-                    status
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(
-            query,
-            variables={'projectId': str(self.project.id)},
-            context=context
+        data = self.execute_ok(
+            TASKS_BY_PROJECT_QUERY,
+            variables={'projectId': self.project_id},
+            context=self.context
         )
-        
-        self.assertIsNone(result.get('errors'))
-        tasks = result['data']['tasksByProject']
+
+        tasks = data['tasksByProject']
         self.assertEqual(len(tasks), 1)
         self.assertEqual(tasks[0]['title'], 'Test Task')
 
-    def test_create_task_mutation(self):
-        """Test creating a task."""
-        mutation = '''
-            mutation CreateTask($projectId: ID!, $title: String!, $description: String) {
-                createTask(projectId: $projectId, title: $title, description: $description) {
-                    success
-                    errors
-                    task {
-                        id
-                        title
-                        description
-                        status
-                    }
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(
-            mutation,
-            variables={
-                'projectId': str(self.project.id),
-                'title': 'New Task',
-                'description': 'A new task'
-            },
-            context=context
-        )
-        
-        self.assertIsNone(result.get('errors'))
-        mutation_data = result['data']['createTask']
-        self.assertTrue(mutation_data['success'])
-        self.assertEqual(mutation_data['task']['title'], 'New Task')
+
+class MutationGraphQLTest(GraphQLTestCase):
+    """Test GraphQL mutations.
+
+    Kept apart from the query classes so those stay read-only and
+    their per-test savepoint rollbacks have nothing to undo.
+    """
+
+    def test_create_mutations(self):
+        """Test the create mutations for each entity.
+
+        The three round-trips are structurally identical, so they run
+        as subTests inside one test (and one transaction rollback)
+        instead of three."""
+        cases = [
+            (CREATE_ORGANIZATION_MUTATION, 'createOrganization',
+             {'name': 'New Organization', 'contactEmail': 'new@example.com'},
+             'organization', 'name', 'New Organization'),
+            (CREATE_PROJECT_MUTATION, 'createProject',
+             {'organizationId': self.organization_id, 'name': 'New Project',
+              'description': 'A new project'},
+             'project', 'name', 'New Project'),
+            (CREATE_TASK_MUTATION, 'createTask',
+             {'projectId': self.project_id, 'title': 'New Task',
+              'description': 'A new task'},
+             'task', 'title', 'New Task'),
+        ]
+
+        for mutation, field, variables, payload, attribute, expected in cases:
+            with self.subTest(field=field):
+                data = self.execute_ok(mutation, variables=variables, context=self.context)
+
+                mutation_data = data[field]
+                self.assertTrue(mutation_data['success'])
+                self.assertEqual(mutation_data[payload][attribute], expected)
 
     def test_add_task_comment_mutation(self):
         """Test adding a comment to a task."""
-        mutation = '''
-            mutation AddTaskComment($taskId: ID!, $content: String!, $authorEmail: String!) {
-                addTaskComment(taskId: $taskId, content: $content, authorEmail: $authorEmail) {
-                    success
-                    errors
-                    comment {
-                        id
-                        content
-                        authorEmail
-                    }
-                }
-            }
-        '''
-        
-        context = self.create_request_with_organization()
-        result = self.client.execute(
-            mutation,
+        data = self.execute_ok(
+            ADD_TASK_COMMENT_MUTATION,
             variables={
-                'taskId': str(self.task.id),
+                'taskId': self.task_id,
                 'content': 'This is a test comment',
                 'authorEmail': 'commenter@example.com'
             },
-            context=context
+            context=self.context
         )
-        
-        self.assertIsNone(result.get('errors'))
-        mutation_data = result['data']['addTaskComment']
+
+        mutation_data = data['addTaskComment']
         self.assertTrue(mutation_data['success'])
         self.assertEqual(mutation_data['comment']['content'], 'This is a test comment')